@@ -112,6 +112,12 @@ class Game(tk.Frame, ABC): # pylint: disable=too-many-ancestors
         Get called when the player loses the game
         """
 
+    def update_game(self) -> None:
+        """
+        Update game-wide states once all game's elements have been updated
+        and rendered in the current frame
+        """
+
     def add_element(self, element: GameElement) -> None:
         """
         Add a GameElement object to the game
@@ -126,6 +132,13 @@ class Game(tk.Frame, ABC): # pylint: disable=too-many-ancestors
         element.delete()
         self.__game_elements.remove(element)
 
+    def detach_element(self, element: GameElement) -> None:
+        """
+        Remove a GameElement object from the game without deleting its game
+        object
+        """
+        self.__game_elements.remove(element)
+
     @property
     def canvas(self) -> tk.Canvas:
         """
@@ -133,6 +146,13 @@ class Game(tk.Frame, ABC): # pylint: disable=too-many-ancestors
         """
         return self.__canvas
 
+    @property
+    def update_delay(self) -> int:
+        """
+        Get the delay in milliseconds between two consecutive game frames
+        """
+        return self.__update_delay
+
     @property
     def is_started(self) -> bool:
         """
@@ -158,8 +178,11 @@ class Game(tk.Frame, ABC): # pylint: disable=too-many-ancestors
         """
         Update and render all game's elements
         """
-        for element in self.__game_elements:
+        # iterate over a snapshot so that elements may add or remove game
+        # elements while being updated
+        for element in tuple(self.__game_elements):
             element.update()
             element.render()
+        self.update_game()
         if self.__started:
             self.after(self.__update_delay, self.animate)
@@ -5,7 +5,7 @@ adventure game.
 import math
 import random
 import time
-from turtle import RawTurtle
+from turtle import RawTurtle, TurtleScreen
 from gamelib import Game, GameElement
 
 
@@ -37,6 +37,7 @@ class Waypoint(TurtleGameElement):
         self.__id1: int
         self.__id2: int
         self.__active: bool = False
+        self.__last_state: tuple[bool, float, float] | None = None
 
     def create(self) -> None:
         self.__id1 = self.canvas.create_line(0, 0, 0, 0, width=2, fill="green")
@@ -51,11 +52,17 @@ class Waypoint(TurtleGameElement):
         pass
 
     def render(self) -> None:
+        state = (self.is_active, self.x, self.y)
+        if state == self.__last_state:
+            return
+        was_active = self.__last_state is not None and self.__last_state[0]
+        self.__last_state = state
         if self.is_active:
-            self.canvas.itemconfigure(self.__id1, state="normal")
-            self.canvas.itemconfigure(self.__id2, state="normal")
-            self.canvas.tag_raise(self.__id1)
-            self.canvas.tag_raise(self.__id2)
+            if not was_active:
+                self.canvas.itemconfigure(self.__id1, state="normal")
+                self.canvas.itemconfigure(self.__id2, state="normal")
+                self.canvas.tag_raise(self.__id1)
+                self.canvas.tag_raise(self.__id2)
             self.canvas.coords(self.__id1, self.x - 10, self.y - 10,
                                self.x + 10, self.y + 10)
             self.canvas.coords(self.__id2, self.x - 10, self.y + 10,
@@ -99,6 +106,9 @@ class Home(TurtleGameElement):
         x, y = pos
         self.x = x
         self.y = y
+        # home never moves, so its bounds only change along with its size
+        self.__bounds: tuple[float, float, float, float]
+        self.__update_bounds()
 
     @property
     def size(self) -> int:
@@ -110,6 +120,12 @@ class Home(TurtleGameElement):
     @size.setter
     def size(self, val: int) -> None:
         self.__size = val
+        self.__update_bounds()
+
+    def __update_bounds(self) -> None:
+        half_size = self.__size / 2
+        self.__bounds = (self.x - half_size, self.y - half_size,
+                         self.x + half_size, self.y + half_size)
 
     def create(self) -> None:
         self.__id = self.canvas.create_rectangle(0, 0, 0, 0, outline="brown",
@@ -123,18 +139,13 @@ class Home(TurtleGameElement):
         pass
 
     def render(self) -> None:
-        self.canvas.coords(self.__id,
-                           self.x - self.size / 2,
-                           self.y - self.size / 2,
-                           self.x + self.size / 2,
-                           self.y + self.size / 2)
+        self.canvas.coords(self.__id, *self.__bounds)
 
     def contains(self, x: float, y: float):
         """
         Check whether home contains the point (x, y).
         """
-        x1, x2 = self.x - self.size / 2, self.x + self.size / 2
-        y1, y2 = self.y - self.size / 2, self.y + self.size / 2
+        x1, y1, x2, y2 = self.__bounds
         return x1 <= x <= x2 and y1 <= y <= y2
 
 
@@ -154,6 +165,7 @@ class Player(TurtleGameElement):
     def create(self) -> None:
         turtle = RawTurtle(self.canvas)
         turtle.getscreen().tracer(False)  # disable turtle's built-in animation
+        turtle.setundobuffer(None)  # the player's moves are never undone
         turtle.shape("turtle")
         turtle.color("green")
         turtle.penup()
@@ -175,40 +187,30 @@ class Player(TurtleGameElement):
         pass
 
     def update(self) -> None:
+        # the player's position is kept as plain floats and only handed over
+        # to the turtle when rendering
+        x, y = self.x, self.y
         # check if player has arrived home
-        if self.game.home.contains(self.x, self.y):
+        if self.game.home.contains(x, y):
             self.game.game_over_win()
-        turtle = self.__turtle
         waypoint = self.game.waypoint
-        if self.game.waypoint.is_active:
-            turtle.setheading(turtle.towards(waypoint.x, waypoint.y))
-            turtle.forward(self.speed)
-            if turtle.distance(waypoint.x, waypoint.y) < self.speed:
+        if waypoint.is_active:
+            # turtle's heading is expressed in the world coordinates set up by
+            # the game, so no y-flip is needed here
+            dx, dy = waypoint.x - x, waypoint.y - y
+            speed = self.speed
+            squared_distance = dx * dx + dy * dy
+            if squared_distance < speed * speed:
                 waypoint.deactivate()
+            else:
+                step = speed / math.sqrt(squared_distance)
+                self.x = x + dx * step
+                self.y = y + dy * step
+                self.__turtle.setheading(math.degrees(math.atan2(dy, dx)))
 
     def render(self) -> None:
+        # the turtle screen is redrawn once per frame by the game
         self.__turtle.goto(self.x, self.y)
-        self.__turtle.getscreen().update()
-
-    # override original property x's getter/setter to use turtle's methods
-    # instead
-    @property
-    def x(self) -> float:
-        return self.__turtle.xcor()
-
-    @x.setter
-    def x(self, val: float) -> None:
-        self.__turtle.setx(val)
-
-    # override original property y's getter/setter to use turtle's methods
-    # instead
-    @property
-    def y(self) -> float:
-        return self.__turtle.ycor()
-
-    @y.setter
-    def y(self, val: float) -> None:
-        self.__turtle.sety(val)
 
 
 class Enemy(TurtleGameElement):
@@ -222,7 +224,11 @@ class Enemy(TurtleGameElement):
                  color: str):
         super().__init__(game)
         self.__size = size
+        self.__half_size = size / 2
         self.__color = color
+        self.__id = None
+        self.__last_pos = None
+        self.__visible = True
 
     @property
     def size(self) -> float:
@@ -238,17 +244,64 @@ class Enemy(TurtleGameElement):
         """
         return self.__color
 
-    def hits_player(self):
+    @property
+    def item_id(self) -> int:
         """
-        Check whether the enemy is hitting the player
+        Get the id of the canvas item representing the enemy
         """
-        return (
-                (
-                            self.x - self.size / 2 < self.game.player.x < self.x + self.size / 2)
-                and
-                (
-                            self.y - self.size / 2 < self.game.player.y < self.y + self.size / 2)
-        )
+        return self.__id
+
+    def create_item(self) -> int:
+        """
+        Create the canvas item representing the enemy and return its id
+        """
+        return self.canvas.create_oval(0, 0, 0, 0, fill=self.color)
+
+    def create(self) -> None:
+        self.__id = self.create_item()
+        self.__last_pos = None
+        self.__visible = True
+
+    def render(self) -> None:
+        # only talk to the canvas when the enemy has actually moved, and not
+        # at all while it stays outside of the screen
+        x, y, half_size = self.x, self.y, self.__half_size
+        if self.__id is None or (x, y) == self.__last_pos:
+            return
+        self.__last_pos = (x, y)
+        visible = (-half_size <= x <= self.game.screen_width + half_size
+                   and -half_size <= y <= self.game.screen_height + half_size)
+        if visible != self.__visible:
+            self.__visible = visible
+            self.canvas.itemconfigure(self.__id,
+                                      state="normal" if visible else "hidden")
+        if not visible:
+            return
+        self.canvas.coords(self.__id,
+                           x - half_size,
+                           y - half_size,
+                           x + half_size,
+                           y + half_size)
+
+    def delete(self) -> None:
+        self.canvas.delete(self.__id)
+        self.__id = None
+
+    @property
+    def is_harmful(self) -> bool:
+        """
+        Get the flag indicating whether touching the enemy kills the player
+        """
+        return True
+
+    def hits_player(self, player_x: float, player_y: float) -> bool:
+        """
+        Check whether the enemy is hitting the player located at
+        (player_x, player_y)
+        """
+        half_size = self.__half_size
+        return (abs(self.x - player_x) < half_size
+                and abs(self.y - player_y) < half_size)
 
 
 # TODO
@@ -287,48 +340,56 @@ class RandomWalkEnemy(Enemy):
     Just keep going from left to right (randomly moves a little)
     """
 
+    # number of pre-generated steps in a step pool; must be a power of two so
+    # that indices can wrap around with a bit mask
+    STEP_POOL_SIZE = 4096
+
     def __init__(self,
                  game: "TurtleAdventureGame",
                  size: int,
                  color: str,
-                 speed: int):
+                 speed: int,
+                 steps: list[int]):
         super().__init__(game, size, color)
-        self.__id = None
-        self.color2 = color
         self.state = self.right
         self.speed = speed
+        self.__steps = steps
+        # start each walker at a different place in the pool so that walkers
+        # sharing it do not move in lockstep
+        self.__step_index = self.game.rng.randrange(self.STEP_POOL_SIZE)
 
-    def create(self) -> None:
-        self.__id = self.canvas.create_oval(0, 0, 0, 0, fill=self.color2)
+    @classmethod
+    def make_step_pool(cls, speed: int, rng: random.Random) -> list[int]:
+        """
+        Generate a pool of random steps for walkers of the given speed, biased
+        towards the current walking direction
+        """
+        return rng.choices(range(-speed + 4, speed + 2),
+                           k=cls.STEP_POOL_SIZE)
+
+    def __next_step(self) -> int:
+        step = self.__steps[self.__step_index]
+        self.__step_index = (self.__step_index + 1) & (self.STEP_POOL_SIZE - 1)
+        return step
 
     def left(self):
         if self.x < 0:
             self.state = self.right
             return
 
-        self.x += random.randint(-self.speed, self.speed - 4 + 1)
+        # mirror the rightward step around 1 px to keep the baseline
+        # leftward range of [-speed, speed - 3]
+        self.x -= self.__next_step() - 1
 
     def right(self):
-        if self.x > self.canvas.winfo_width():
+        if self.x > self.game.screen_width:
             self.state = self.left
             return
 
-        self.x += random.randint(-self.speed + 4, self.speed + 1)
+        self.x += self.__next_step()
 
     def update(self) -> None:  # Movement
         self.state()
-        if self.hits_player():
-            self.game.game_over_lose()
-
-    def render(self) -> None:
-        self.canvas.coords(self.__id,
-                           self.x - self.size / 2,
-                           self.y - self.size / 2,
-                           self.x + self.size / 2,
-                           self.y + self.size / 2)
-
-    def delete(self) -> None:
-        pass
 
 
 class ChasingEnemy(Enemy):
@@ -343,66 +404,16 @@ class ChasingEnemy(Enemy):
                  color: str,
                  speed: int):
         super().__init__(game, size, color)
-        self.__id = None
-        self.color2 = color
-        self.xstate = self.right
-        self.ystate = self.up
         self.speed = speed / 3
 
-    def create(self) -> None:
-        self.__id = self.canvas.create_oval(0, 0, 0, 0, fill=self.color2)
-
-    def left(self):
-        if self.x < self.game.player.x:
-            self.xstate = self.right
-            return
-
-        self.x -= self.speed * math.cos(
-            math.atan(abs(self.game.player.y - self.y) / abs(
-                self.game.player.x - self.x)))
-
-    def right(self):
-        if self.x > self.game.player.x:
-            self.xstate = self.left
-            return
-
-        self.x += self.speed * math.cos(
-            math.atan(abs(self.game.player.y - self.y) / abs(
-                self.game.player.x - self.x)))
-
-    def up(self):
-        if self.y < self.game.player.y:
-            self.ystate = self.down
-            return
-
-        self.y -= self.speed * math.sin(
-            math.atan(abs(self.game.player.y - self.y) / abs(
-                self.game.player.x - self.x)))
-
-    def down(self):
-        if self.y > self.game.player.y:
-            self.ystate = self.up
-            return
-
-        self.y += self.speed * math.sin(
-            math.atan(abs(self.game.player.y - self.y) / abs(
-                self.game.player.x - self.x)))
-
     def update(self) -> None:  # Movement
-        self.xstate()
-        self.ystate()
-        if self.hits_player():
-            self.game.game_over_lose()
-
-    def render(self) -> None:
-        self.canvas.coords(self.__id,
-                           self.x - self.size / 2,
-                           self.y - self.size / 2,
-                           self.x + self.size / 2,
-                           self.y + self.size / 2)
-
-    def delete(self) -> None:
-        pass
+        # head straight for the player on each axis, but stand still on an
+        # axis once within one step of the player to avoid jittering around
+        dx = self.game.player.x - self.x
+        dy = self.game.player.y - self.y
+        speed = self.speed
+        self.x += (abs(dx) > speed) * math.copysign(speed, dx)
+        self.y += (abs(dy) > speed) * math.copysign(speed, dy)
 
 
 class FencingEnemy(Enemy):
@@ -417,60 +428,38 @@ class FencingEnemy(Enemy):
                  color: str,
                  speed: int):
         super().__init__(game, size, color)
-        self.__id = None
-        self.color2 = color
-        self.state = self.down
         self.speed = speed / 4
-        self.home_top = self.game.home.y - (self.game.home.size / 2) - 20
-        self.home_bottom = self.game.home.y + (self.game.home.size / 2) + 20
-        self.home_left = self.game.home.x - (self.game.home.size / 2) - 20
-        self.home_right = self.game.home.x + (self.game.home.size / 2) + 20
-
-    def create(self) -> None:
-        self.__id = self.canvas.create_oval(0, 0, 0, 0, fill=self.color2)
-
-    def down(self):
-        if self.y >= self.home_bottom:
-            self.state = self.right
-            return
-
-        self.y += self.speed
-
-    def right(self):
-        if self.x >= self.home_right:
-            self.state = self.up
-            return
-
-        self.x += self.speed
-
-    def up(self):
-        if self.y <= self.home_top:
-            self.state = self.left
-            return
-
-        self.y += -self.speed
-
-    def left(self):
-        if self.x <= self.home_left:
-            self.state = self.down
-            return
-
-        self.x += -self.speed
+        home = self.game.home
+        margin = home.size / 2 + 20
+        self.home_top = home.y - margin
+        self.home_bottom = home.y + margin
+        self.home_left = home.x - margin
+        self.home_right = home.x + margin
+        # the enemy walks down, right, up and then left around home, starting
+        # from the top-left corner; its position is derived from the distance
+        # walked along that loop
+        width = self.home_right - self.home_left
+        height = self.home_bottom - self.home_top
+        self.__corners = (height, height + width, 2 * height + width)
+        self.__perimeter = 2 * (height + width)
+        self.__distance = 0.0
 
     def update(self) -> None:  # Movement
-        self.state()
-        if self.hits_player():
-            self.game.game_over_lose()
-
-    def render(self) -> None:
-        self.canvas.coords(self.__id,
-                           self.x - self.size / 2,
-                           self.y - self.size / 2,
-                           self.x + self.size / 2,
-                           self.y + self.size / 2)
-
-    def delete(self) -> None:
-        pass
+        distance = (self.__distance + self.speed) % self.__perimeter
+        self.__distance = distance
+        bottom_left, bottom_right, top_right = self.__corners
+        if distance < bottom_left:
+            self.x = self.home_left
+            self.y = self.home_top + distance
+        elif distance < bottom_right:
+            self.x = self.home_left + (distance - bottom_left)
+            self.y = self.home_bottom
+        elif distance < top_right:
+            self.x = self.home_right
+            self.y = self.home_bottom - (distance - bottom_right)
+        else:
+            self.x = self.home_right - (distance - top_right)
+            self.y = self.home_top
 
 
 class DeDestroyerEnemy(Enemy):
@@ -485,44 +474,52 @@ class DeDestroyerEnemy(Enemy):
                  color: str,
                  speed: int):
         super().__init__(game, size, color)
-        self.__id = None
         self.__id2 = None
         self.__id3 = None
-        self.color2 = color
+        self.__laser_visible = False
         self.timer = 0
         self.distance_barrel = 50
         self.fire_rate = int(100/self.game.level)
 
+    @property
+    def is_harmful(self) -> bool:
+        # the destroyer only hurts the player through its bombs
+        return False
+
+    def create_item(self) -> int:
+        return self.canvas.create_rectangle(0, 0, 0, 0, fill=self.color)
+
     def create(self) -> None:
-        self.__id = self.canvas.create_rectangle(0, 0, 0, 0, fill=self.color2)
-        self.__id2 = self.canvas.create_line(0, 0, 0, 0, fill='orange', width=3)
+        super().create()
+        self.__id2 = self.canvas.create_line(0, 0, 0, 0, fill='orange', width=3,
+                                             state='hidden')
+        self.__laser_visible = False
 
     def update(self) -> None:  # Movement
         self.timer += 1
         if self.timer % self.fire_rate == 0:
-            bomb = Bomb(self.game, 70)
-            bomb.x = self.game.player.x + random.randint(-50, 51)
-            bomb.y = self.game.player.y + random.randint(-50, 51)
-            self.game.add_element(bomb)
+            self.game.enemy_generator.spawn_bomb(
+                self.game.player.x + self.game.rng.randint(-50, 51),
+                self.game.player.y + self.game.rng.randint(-50, 51))
 
     def render(self) -> None:
-        self.canvas.coords(self.__id,
-                           self.x - self.size / 2,
-                           self.y - self.size / 2,
-                           self.x + self.size / 2,
-                           self.y + self.size / 2)
-        if self.timer % self.fire_rate == 0:
-            self.canvas.itemconfigure(self.__id2, fill='orange')
+        super().render()
+        firing = self.timer % self.fire_rate == 0
+        if firing:
             self.canvas.coords(self.__id2,
                                self.x,
                                self.y,
                                self.game.player.x,
                                self.game.player.y)
-        else:
-            self.canvas.itemconfigure(self.__id2, fill='white')
+        # only show or hide the laser when it starts or stops firing
+        if firing != self.__laser_visible:
+            self.__laser_visible = firing
+            self.canvas.itemconfigure(self.__id2,
+                                      state='normal' if firing else 'hidden')
 
     def delete(self) -> None:
-        pass
+        super().delete()
+        self.canvas.delete(self.__id2)
 
 
 class Bomb(Enemy):
@@ -536,33 +533,29 @@ class Bomb(Enemy):
                  size: int,
                  ):
         super().__init__(game, size, 'grey')
-        self.__id = None
         self.timer = 0
 
-    def create(self) -> None:
-        self.__id = self.canvas.create_oval(0, 0, 0, 0, fill='grey')
+    @property
+    def is_harmful(self) -> bool:
+        # a bomb only hurts the player on the frame it explodes
+        return self.timer == 20
+
+    def create_item(self) -> int:
+        if self.item_id is None:
+            return super().create_item()
+        # a recycled bomb still owns the canvas item of its earlier explosion
+        self.canvas.itemconfigure(self.item_id, fill=self.color,
+                                  state="normal")
+        return self.item_id
 
     def update(self) -> None:  # Movement
         self.timer += 1
         if self.timer >= 21:
-            self.delete()
+            self.game.enemy_generator.recycle_bomb(self)
             return
 
         if self.timer >= 20:
-            self.canvas.itemconfigure(self.__id, fill='red')
-
-            if self.hits_player():
-                self.game.game_over_lose()
-
-    def render(self) -> None:
-        self.canvas.coords(self.__id,
-                           self.x - self.size / 2,
-                           self.y - self.size / 2,
-                           self.x + self.size / 2,
-                           self.y + self.size / 2)
-
-    def delete(self) -> None:
-        self.canvas.delete(self.__id)
+            self.canvas.itemconfigure(self.item_id, fill='red')
 
 
 class EnemyGenerator:
@@ -575,6 +568,8 @@ class EnemyGenerator:
         self.__game: TurtleAdventureGame = game
         self.__level: int = level
 
+        self.__bomb_pool: list[Bomb] = []
+
         self.__default_enemies = {
             1: 2,
             2: 4,
@@ -582,9 +577,18 @@ class EnemyGenerator:
             4: 10
         }
 
-        # example
-        self.__game.after(100, self.create_enemy)
         self.__speed = self.__level * 3
+        # random steps shared by all walkers of this game
+        self.__walk_steps = RandomWalkEnemy.make_step_pool(self.__speed,
+                                                           self.__game.rng)
+        # spawn enemies in two schedules, each creating an enemy every
+        # 4000/level ms counted in game frames: one starting right away (see
+        # the create_enemy() call below) and one starting 100 ms later
+        update_delay = self.__game.update_delay
+        self.__spawn_interval = max(1, round(4000 / self.__level
+                                             / update_delay))
+        self.__spawn_countdowns = [self.__spawn_interval,
+                                   max(1, round(100 / update_delay))]
 
         self.enemy_dict = {
             RandomWalkEnemy: ['random', 'purple'],
@@ -592,6 +596,9 @@ class EnemyGenerator:
             FencingEnemy: ['home', 'green'],
             DeDestroyerEnemy: ['random', 'black']
         }
+        # (enemy class, (position, color)) pairs to pick from when spawning
+        self.__enemy_kinds = tuple(
+            (kind, tuple(spec)) for kind, spec in self.enemy_dict.items())
 
         self.start_enemy_count = self.__default_enemies[self.__level]
 
@@ -613,53 +620,72 @@ class EnemyGenerator:
         return self.__level
 
     def create_start_enemy(self):
+        """
+        Create the enemies present when the game starts
+        """
+        while self.start_enemy_count > 0:
+            self.start_enemy_count -= 1
+            self.create_enemy()
 
-        if self.start_enemy_count <= 0:
-            return
-
-        self.start_enemy_count -= 1
-
-        enemy_dict = list(self.enemy_dict.keys())
-        enemy_dict.remove(DeDestroyerEnemy)
+    def tick(self) -> None:
+        """
+        Advance the spawning schedule by one game frame
+        """
+        countdowns = self.__spawn_countdowns
+        for i, countdown in enumerate(countdowns):
+            countdown -= 1
+            if countdown <= 0:
+                countdown = self.__spawn_interval
+                self.create_enemy()
+            countdowns[i] = countdown
 
-        random_enemy = random.choice(list(self.enemy_dict.keys()))
-        enemy = random_enemy(self.__game, 20, self.enemy_dict[random_enemy][1],
-                             self.__speed)
-        position = self.enemy_dict[random_enemy][0]
+    def create_enemy(self) -> None:
+        """
+        Create a new enemy, possibly based on the game level
+        """
+        rng = self.__game.rng
+        random_enemy, (position, color) = rng.choice(self.__enemy_kinds)
+        if random_enemy is RandomWalkEnemy:
+            enemy = RandomWalkEnemy(self.__game, 20, color, self.__speed,
+                                    self.__walk_steps)
+        else:
+            enemy = random_enemy(self.__game, 20, color, self.__speed)
 
         if position == "home":
             enemy.x = self.game.home.x - (self.game.home.size / 2) - 20
             enemy.y = self.game.home.y - (self.game.home.size / 2) - 20
         else:
-            enemy.x = random.randint(0, self.__game.screen_width)
-            enemy.y = random.randint(0, self.__game.screen_height)
-            while 40 < enemy.x < 60:
-                enemy.x = random.randint(0, self.__game.screen_width)
+            # stay out of the 40 < x < 60 band where the player starts by
+            # sampling the remaining range directly and shifting past the band
+            x = rng.randint(0, self.__game.screen_width - 19)
+            if x > 40:
+                x += 19
+            enemy.x = x
+            enemy.y = rng.randint(0, self.__game.screen_height)
 
-        self.game.add_element(enemy)
-        self.game.after(0, self.create_start_enemy)
+        self.game.add_enemy(enemy)
 
-    def create_enemy(self) -> None:
+    def spawn_bomb(self, x: float, y: float) -> None:
         """
-        Create a new enemy, possibly based on the game level
+        Place a bomb at (x, y), reusing an exploded one when available
         """
-
-        random_enemy = random.choice(list(self.enemy_dict.keys()))
-        enemy = random_enemy(self.__game, 20, self.enemy_dict[random_enemy][1],
-                             self.__speed)
-        position = self.enemy_dict[random_enemy][0]
-
-        if position == "home":
-            enemy.x = self.game.home.x - (self.game.home.size / 2) - 20
-            enemy.y = self.game.home.y - (self.game.home.size / 2) - 20
+        if self.__bomb_pool:
+            bomb = self.__bomb_pool.pop()
         else:
-            enemy.x = random.randint(0, self.__game.screen_width)
-            enemy.y = random.randint(0, self.__game.screen_height)
-            while 40 < enemy.x < 60:
-                enemy.x = random.randint(0, self.__game.screen_width)
+            bomb = Bomb(self.game, 70)
+        bomb.timer = 0
+        bomb.x = x
+        bomb.y = y
+        self.game.add_enemy(bomb)
 
-        self.game.add_element(enemy)
-        self.game.after(int(4000 / self.game.level), self.create_enemy)
+    def recycle_bomb(self, bomb: Bomb) -> None:
+        """
+        Take an exploded bomb off the game and keep it, along with its hidden
+        canvas item, to be reused by a later spawn_bomb() call
+        """
+        self.game.canvas.itemconfigure(bomb.item_id, state="hidden")
+        self.game.detach_enemy(bomb)
+        self.__bomb_pool.append(bomb)
 
 
 class TurtleAdventureGame(Game):  # pylint: disable=too-many-ancestors
@@ -669,13 +695,17 @@ class TurtleAdventureGame(Game):  # pylint: disable=too-many-ancestors
 
     # pylint: disable=too-many-instance-attributes
     def __init__(self, parent, screen_width: int, screen_height: int,
-                 level: int = 1):
+                 level: int = 1, seed: int | None = None):
         self.level: int = level
         self.screen_width: int = screen_width
         self.screen_height: int = screen_height
+        # a single random number generator shared by everything in the game;
+        # it must be seeded here as enemies are spawned while initializing
+        self.rng: random.Random = random.Random(seed)
         self.waypoint: Waypoint
         self.player: Player
         self.home: Home
+        self.screen: TurtleScreen
         self.enemies: list[Enemy] = []
         self.enemy_generator: EnemyGenerator
         super().__init__(parent)
@@ -683,9 +713,10 @@ class TurtleAdventureGame(Game):  # pylint: disable=too-many-ancestors
     def init_game(self):
         self.canvas.config(width=self.screen_width, height=self.screen_height)
         turtle = RawTurtle(self.canvas)
+        self.screen = turtle.getscreen()
         # set turtle screen's origin to the top-left corner
-        turtle.screen.setworldcoordinates(0, self.screen_height - 1,
-                                          self.screen_width - 1, 0)
+        self.screen.setworldcoordinates(0, self.screen_height - 1,
+                                        self.screen_width - 1, 0)
 
         self.waypoint = Waypoint(self)
         self.add_element(self.waypoint)
@@ -710,6 +741,31 @@ class TurtleAdventureGame(Game):  # pylint: disable=too-many-ancestors
         self.enemies.append(enemy)
         self.add_element(enemy)
 
+    def remove_enemy(self, enemy: Enemy) -> None:
+        """
+        Remove an enemy from the current game
+        """
+        self.enemies.remove(enemy)
+        self.delete_element(enemy)
+
+    def detach_enemy(self, enemy: Enemy) -> None:
+        """
+        Remove an enemy from the current game without deleting its canvas
+        item
+        """
+        self.enemies.remove(enemy)
+        self.detach_element(enemy)
+
+    def update_game(self) -> None:
+        # check all enemies against the player in a single pass
+        player_x, player_y = self.player.x, self.player.y
+        for enemy in self.enemies:
+            if enemy.is_harmful and enemy.hits_player(player_x, player_y):
+                self.game_over_lose()
+                break
+        self.enemy_generator.tick()
+        self.screen.update()
+
     def game_over_win(self) -> None:
         """
         Called when the player wins the game and stop the game